@@ -39,17 +39,26 @@ Options
 - --local-clone    : Use an existing local clone instead of cloning
 - --outdir         : Where organized outputs will be written
 - --force          : Overwrite outdir if it exists
+- --jobs           : Number of worker processes (defaults to CPU count)
 """
 
 import argparse
 import csv
+import functools
 import json
 import os
 import re
 import shutil
 import subprocess
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Pattern, Set, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional; stdlib json produces the same output, slower
+    orjson = None
 
 
 DEFAULT_REPO_URL = "https://github.com/ioccc-src/winner.git"
@@ -76,17 +85,19 @@ def ensure_clone(repo_url: str, workdir: Path, local_clone: Optional[Path], bran
     clone_dir = workdir / repo_name.stem
 
     if clone_dir.exists():
-        # Already cloned, pull latest
-        code, out, err = run(["git", "fetch", "--all"], cwd=clone_dir)
-        if code != 0:
-            print("Warning: git fetch failed, continuing with existing clone.")
+        # Already cloned, pull latest. Each step warns and carries on if it
+        # fails. `fetch --all` already brought the upstream refs in, so
+        # fast-forward to them rather than `git pull`, which would fetch again.
+        steps = [(["git", "fetch", "-q", "--all"],
+                  "Warning: git fetch failed, continuing with existing clone")]
         if branch:
-            code, out, err = run(["git", "checkout", branch], cwd=clone_dir)
+            steps.append((["git", "checkout", "-q", branch], f"Warning: git checkout {branch} failed"))
+        steps.append((["git", "merge", "-q", "--ff-only", "@{upstream}"],
+                      "Warning: git fast-forward failed, continuing with existing clone"))
+        for cmd, warning in steps:
+            code, out, err = run(cmd, cwd=clone_dir)
             if code != 0:
-                print(f"Warning: git checkout {branch} failed: {err.strip()}")
-        code, out, err = run(["git", "pull", "--ff-only"], cwd=clone_dir)
-        if code != 0:
-            print("Warning: git pull failed, continuing with existing clone.")
+                print(f"{warning}: {err.strip()}")
     else:
         code, out, err = run(["git", "clone", repo_url, str(clone_dir)])
         if code != 0:
@@ -99,26 +110,39 @@ def ensure_clone(repo_url: str, workdir: Path, local_clone: Optional[Path], bran
     return clone_dir
 
 
+def _hint(pattern: bytes) -> Pattern[bytes]:
+    """
+    Compile a bytes hint pattern. Bytes-mode \\s is ASCII-only, so wherever the
+    hint allows whitespace also accept a UTF-8 no-break space (common in
+    index.html), which the str patterns used to match.
+    """
+    return re.compile(pattern.replace(rb"\s", rb"(?:\s|\xc2\xa0)"), re.IGNORECASE)
+
+
+# Hints are listed per field in priority order (earlier hints win). They are
+# bytes patterns so raw file contents can be scanned without decoding them.
 AWARD_HINTS = [
-    r"(?i)\baward\b\s*:\s*(.+)",
-    r"(?i)\bcategory\b\s*:\s*(.+)",
-    r"(?i)\branking\b\s*:\s*(.+)",
-    r"(?i)\bprize\b\s*:\s*(.+)",
-    r"(?i)\b(honou?rable mention|honorable mention)\b",
-    r"(?i)\b(best|most|worst)\b[^\n]+",  # e.g., "Most over-engineered"
+    _hint(rb"\baward\b\s*:\s*(.+)"),
+    _hint(rb"\bcategory\b\s*:\s*(.+)"),
+    _hint(rb"\branking\b\s*:\s*(.+)"),
+    _hint(rb"\bprize\b\s*:\s*(.+)"),
+    _hint(rb"\b(honou?rable mention|honorable mention)\b"),
+    _hint(rb"\b(best|most|worst)\b[^\n]+"),  # e.g., "Most over-engineered"
 ]
 
 AUTHOR_HINTS = [
-    r"(?i)\bauthor[s]?\b\s*:\s*(.+)",
-    r"(?i)\bby\s+([^\n]+)",
+    _hint(rb"\bauthor[s]?\b\s*:\s*(.+)"),
+    _hint(rb"\bby\s+([^\n]+)"),
 ]
 
 SUMMARY_HINTS = [
-    r"(?i)\bsummary\b\s*:\s*(.+)",
-    r"(?i)\bdescription\b\s*:\s*(.+)",
-    r"(?i)\bwhat it does\b\s*:\s*(.+)",
+    _hint(rb"\bsummary\b\s*:\s*(.+)"),
+    _hint(rb"\bdescription\b\s*:\s*(.+)"),
+    _hint(rb"\bwhat it does\b\s*:\s*(.+)"),
 ]
 
+HINT_FIELDS = (("award", AWARD_HINTS), ("authors", AUTHOR_HINTS), ("summary", SUMMARY_HINTS))
+
 
 TEXTY_FILES = [
     "README", "README.txt", "README.md", "readme", "readme.txt", "readme.md",
@@ -127,39 +151,63 @@ TEXTY_FILES = [
 ]
 
 
-def read_text_safely(p: Path, max_bytes: int = 512_000) -> str:
+# Award/author lines sit near the top of side files; don't read past this.
+SIDE_FILE_MAX_BYTES = 8192
+
+
+def read_bytes_safely(p: Path, max_bytes: int = 512_000) -> bytes:
     try:
-        data = p.read_bytes()[:max_bytes]
-        return data.decode("utf-8", errors="ignore")
+        with p.open("rb") as f:
+            return f.read(max_bytes)
     except Exception:
-        return ""
+        return b""
+
 
+def decode_text(data: bytes) -> str:
+    return data.decode("utf-8", errors="ignore")
 
-def search_patterns(text: str, patterns: List[str]) -> Optional[str]:
+
+def search_patterns(data: bytes, patterns: List[Pattern[bytes]]) -> Optional[str]:
     for pat in patterns:
-        m = re.search(pat, text)
+        m = pat.search(data)
         if m:
             if m.groups():
-                return m.group(1).strip()
-            return m.group(0).strip()
+                return decode_text(m.group(1)).strip()
+            return decode_text(m.group(0)).strip()
     return None
 
 
+def search_hints(data: bytes) -> Dict[str, Optional[str]]:
+    """
+    Search data for every field's hints in priority order. Only the captured
+    values are decoded.
+    """
+    return {field: search_patterns(data, patterns) for field, patterns in HINT_FIELDS}
+
+
 def extract_from_c_header(c_path: Path) -> Dict[str, Optional[str]]:
     """
     Look at the top of the C file for a block comment with descriptors.
     """
-    head = read_text_safely(c_path, max_bytes=64_000)
-    # extract first comment block
-    m = re.search(r"/\*.*?\*/", head, flags=re.S)
-    text = m.group(0) if m else head[:2000]
+    head = read_bytes_safely(c_path, max_bytes=64_000)
+    # extract first comment block; bytes.find gives the same span as a lazy
+    # /\*.*?\*/ search without the regex engine stepping through the buffer
+    start = head.find(b"/*")
+    end = head.find(b"*/", start + 2) if start != -1 else -1
+    if end != -1:
+        comment = head[start:end + 2]
+    else:
+        # no comment block: fall back to the first 2000 characters (not bytes)
+        comment = decode_text(head)[:2000].encode("utf-8")
 
-    award = search_patterns(text, AWARD_HINTS)
-    authors = search_patterns(text, AUTHOR_HINTS)
-    summary = search_patterns(text, SUMMARY_HINTS)
+    hints = search_hints(comment)
+    award = hints["award"]
+    authors = hints["authors"]
+    summary = hints["summary"]
 
     # As a fallback, take the first 1-2 lines that look descriptive
     if not summary:
+        text = decode_text(comment)
         lines = [ln.strip("/* #\t -") for ln in text.splitlines() if ln.strip()]
         if lines:
             summary = lines[0]
@@ -171,30 +219,43 @@ def extract_from_c_header(c_path: Path) -> Dict[str, Optional[str]]:
 
 def extract_from_side_files(entry_dir: Path) -> Dict[str, Optional[str]]:
     merged = {"award": None, "authors": None, "summary": None}
+    # Probe names in TEXTY_FILES order, as exists() did, but keep the stat
+    # result: on case-insensitive filesystems README/readme or
+    # Makefile/makefile resolve to the same file, which is then parsed once.
+    parsed: Set[Tuple[int, int]] = set()
     for fname in TEXTY_FILES:
-        p = entry_dir / fname
-        if not p.exists():
-            continue
-        text = read_text_safely(p)
-        if not merged["award"]:
-            merged["award"] = search_patterns(text, AWARD_HINTS)
-        if not merged["authors"]:
-            merged["authors"] = search_patterns(text, AUTHOR_HINTS)
-        if not merged["summary"]:
-            merged["summary"] = search_patterns(text, SUMMARY_HINTS)
         if all(merged.values()):
             break
+        p = entry_dir / fname
+        try:
+            st = p.stat()
+        except OSError:
+            continue
+        if (st.st_dev, st.st_ino) in parsed:
+            continue
+        parsed.add((st.st_dev, st.st_ino))
+        hints = search_hints(read_bytes_safely(p, max_bytes=SIDE_FILE_MAX_BYTES))
+        for key, value in hints.items():
+            if not merged[key]:
+                merged[key] = value
 
     return merged
 
 
+_SLUG_WS = re.compile(r"[\s/]+")
+_SLUG_BAD = re.compile(r"[^a-zA-Z0-9_.-]+")
+
+
 def short_slug(s: Optional[str]) -> str:
     if not s:
         return "unknown"
-    s = s.strip()
-    s = re.sub(r"[\s/]+", "_", s)
-    s = re.sub(r"[^a-zA-Z0-9_.-]+", "", s)
-    return s[:64] if len(s) > 64 else s
+    s = _SLUG_WS.sub("_", s.strip())
+    s = _SLUG_BAD.sub("", s)
+    return s[:64]
+
+
+# First path segment that is exactly four digits, and the segment after it
+YEAR_SEG = re.compile(r"(?:^|/)(\d{4})/([^/]+)")
 
 
 def guess_year_and_entry(c_path: Path, repo_root: Path) -> Tuple[str, str]:
@@ -202,27 +263,87 @@ def guess_year_and_entry(c_path: Path, repo_root: Path) -> Tuple[str, str]:
     Heuristic: look for path segments that look like /<year>/<entry>/...
     If not found, fallback to 'unknown'.
     """
-    rel = c_path.relative_to(repo_root)
-    parts = rel.parts
-    year = "unknown"
-    entry = "unknown"
-    # Look for a 4-digit year in parts
-    for i, seg in enumerate(parts):
-        if re.fullmatch(r"\d{4}", seg):
-            year = seg
-            if i + 1 < len(parts):
-                entry = parts[i + 1]
-            break
-    # sanitize entry
-    entry = short_slug(entry)
-    return year, entry
+    m = YEAR_SEG.search(c_path.relative_to(repo_root).as_posix())
+    if not m:
+        return "unknown", "unknown"
+    return m.group(1), short_slug(m.group(2))
+
+
+def entry_root(c_path: Path, repo_root: Path) -> Path:
+    """
+    Directory holding the whole entry: <year>/<entry> when the path has one,
+    otherwise the directory containing the .c file.
+    """
+    rel = c_path.relative_to(repo_root).as_posix()
+    m = YEAR_SEG.search(rel)
+    if m:
+        root = repo_root / rel[:m.end()]
+        if root != c_path:
+            return root
+    return c_path.parent
+
+
+def iter_c_files(root: Path) -> Iterator[Path]:
+    """
+    Recursively yield .c files under root. Uses os.scandir so file types come
+    from the cached DirEntry rather than a stat per path; .git is skipped.
+    """
+    stack = [str(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for e in it:
+                if e.is_dir(follow_symlinks=False):
+                    if e.name != ".git":
+                        stack.append(e.path)
+                elif e.name.endswith(".c") and e.is_file():
+                    yield Path(e.path)
 
 
 def find_c_files(repo_root: Path) -> List[Path]:
-    return [p for p in repo_root.rglob("*.c") if p.is_file()]
+    return list(iter_c_files(repo_root))
+
+
+def ensure_dir(d: Path, made_dirs: Set[Path]) -> None:
+    """
+    mkdir -p d, skipping the syscalls when d is already in made_dirs.
+    """
+    if d in made_dirs:
+        return
+    d.mkdir(parents=True, exist_ok=True)
+    made_dirs.add(d)
+
+
+def fast_copy(src: Path, dst: Path) -> None:
+    """
+    Copy src to dst without routing bytes through Python. copy_file_range lets
+    filesystems such as btrfs/XFS share extents instead of copying data; when
+    it is unavailable or refused (e.g. EXDEV), fall back to shutil.copy2.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if n == 0:
+                        # some kernels/filesystems report 0 instead of failing
+                        raise OSError("copy_file_range stopped before end of file")
+                    remaining -= n
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
 
 
 def write_descriptor(out_dir: Path, data: Dict) -> None:
+    if orjson is not None:
+        (out_dir / "descriptor.json").write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
     (out_dir / "descriptor.json").write_text(
         json.dumps(data, indent=2, ensure_ascii=False),
         encoding="utf-8"
@@ -237,6 +358,104 @@ def ensure_clean_outdir(outdir: Path, force: bool):
     outdir.mkdir(parents=True, exist_ok=True)
 
 
+def process_entry(entry_dir: Path, c_paths: List[Path], repo_root: Path, outdir: Path) -> List[str]:
+    """
+    Organize entry_dir (holding c_paths) under outdir and return its manifest row.
+    Runs in a worker process; it must not rely on state shared with other entries.
+    """
+    # Prefer a top-level source of the entry for the header probe
+    c_path = min(c_paths, key=lambda p: (len(p.parts), p))
+    year, entry = guess_year_and_entry(c_path, repo_root)
+
+    # Probe for side metadata from entry dir, if it exists:
+    side = extract_from_side_files(entry_dir)
+
+    # Probe C header comment (first source file in the entry), unless the
+    # side files already supplied everything the merge below would use:
+    if all(side.values()):
+        head = {"award": None, "authors": None, "summary": None}
+    else:
+        head = extract_from_c_header(c_path)
+
+    # Merge heuristic (prefer side file award if present):
+    award = side["award"] or head["award"] or "unknown"
+    authors = side["authors"] or head["authors"] or "unknown"
+    summary = side["summary"] or head["summary"] or f"IOCCC entry {entry} ({year})"
+
+    award_slug = short_slug(award)
+
+    # Build output path: /year/award/entry/
+    target_dir = outdir / year / award_slug / entry
+    made_dirs: Set[Path] = set()
+    ensure_dir(target_dir, made_dirs)
+
+    # Copy ONLY .c files from the entry directory (and subdirs) for this entry
+    # We detect the entry root as the parent directory that contains the current .c
+    # but we limit copies to files under that parent that are .c
+    # (prevents bringing along README and other artifacts).
+    for p in iter_c_files(entry_dir):
+        rel = p.relative_to(entry_dir)
+        dest = target_dir / rel
+        ensure_dir(dest.parent, made_dirs)
+        fast_copy(p, dest)
+
+    # Build descriptor
+    descriptor = {
+        "year": year,
+        "entry": entry,
+        "award": award,
+        "authors": authors,
+        "original_path": str(entry_dir.resolve()),
+        "source_files": sorted([str(Path("."+os.sep) / f.relative_to(target_dir)) for f in iter_c_files(target_dir)]),
+        "summary": summary,
+        "LLM_context": (
+            "This directory contains only the C source files of an IOCCC winning entry. "
+            "The code is intentionally obfuscated or unusually constructed. "
+            "When analyzing, first read descriptor.json for year, award, and authors. "
+            "Focus on top-of-file comments, macros, and unusual control flow to infer purpose. "
+            "Avoid relying on removed README/Makefiles from the original repo."
+        ),
+    }
+    write_descriptor(target_dir, descriptor)
+
+    return [year, award, entry, authors, str(target_dir)]
+
+
+def build_tasks(c_files: List[Path], repo_root: Path) -> Dict[Tuple[str, str], Dict[Path, List[Path]]]:
+    """
+    Group C files into worker tasks keyed by (year, entry), each mapping entry
+    roots to their files. An entry can spread .c files over several
+    directories, so each entry root is processed once; roots with the same key
+    land in the same output directory (e.g. every root with no year), so they
+    share a task.
+    """
+    tasks: Dict[Tuple[str, str], Dict[Path, List[Path]]] = defaultdict(dict)
+    for p in sorted(c_files):
+        roots = tasks[guess_year_and_entry(p, repo_root)]
+        roots.setdefault(entry_root(p, repo_root), []).append(p)
+    # Sorted keys keep the streamed manifest independent of directory walk order
+    return dict(sorted(tasks.items()))
+
+
+def process_entries(roots: Dict[Path, List[Path]], repo_root: Path, outdir: Path) -> List[List[str]]:
+    """
+    Process entry roots that share a (year, entry) output key, one after the
+    other. They can write the same target directory, so they must never run
+    in separate workers.
+    """
+    return [process_entry(root, c_paths, repo_root, outdir) for root, c_paths in roots.items()]
+
+
+def positive_int(value: str) -> int:
+    try:
+        n = int(value)
+    except ValueError:
+        n = 0
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value!r}")
+    return n
+
+
 def main():
     ap = argparse.ArgumentParser(description="IOCCC winners scraper and organizer")
     ap.add_argument("--repo-url", default=DEFAULT_REPO_URL, help="Git repo URL to clone")
@@ -245,6 +464,7 @@ def main():
     ap.add_argument("--local-clone", default=None, help="Existing clone path (skips cloning)")
     ap.add_argument("--outdir", default="./iocc_out", help="Output directory")
     ap.add_argument("--force", action="store_true", help="Overwrite output directory if exists")
+    ap.add_argument("--jobs", type=positive_int, default=None, help="Worker processes (defaults to CPU count)")
     args = ap.parse_args()
 
     workdir = Path(args.workdir).resolve()
@@ -256,65 +476,22 @@ def main():
 
     c_files = find_c_files(repo_root)
 
-    manifest_rows = []
-    for c_path in c_files:
-        year, entry = guess_year_and_entry(c_path, repo_root)
+    tasks = build_tasks(c_files, repo_root)
 
-        # Probe for side metadata from entry dir, if it exists:
-        entry_dir = c_path.parent
-        side = extract_from_side_files(entry_dir)
-
-        # Probe C header comment:
-        head = extract_from_c_header(c_path)
-
-        # Merge heuristic (prefer side file award if present):
-        award = side["award"] or head["award"] or "unknown"
-        authors = side["authors"] or head["authors"] or "unknown"
-        summary = side["summary"] or head["summary"] or f"IOCCC entry {entry} ({year})"
-
-        award_slug = short_slug(award)
-
-        # Build output path: /year/award/entry/
-        target_dir = outdir / year / award_slug / entry
-        target_dir.mkdir(parents=True, exist_ok=True)
-
-        # Copy ONLY .c files from the entry directory (and subdirs) for this entry
-        # We detect the entry root as the parent directory that contains the current .c
-        # but we limit copies to files under that parent that are .c
-        # (prevents bringing along README and other artifacts).
-        for p in entry_dir.rglob("*.c"):
-            rel = p.relative_to(entry_dir)
-            dest = target_dir / rel
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(p, dest)
-
-        # Build descriptor
-        descriptor = {
-            "year": year,
-            "entry": entry,
-            "award": award,
-            "authors": authors,
-            "original_path": str(c_path.parent.resolve()),
-            "source_files": sorted([str(Path("."+os.sep) / f.relative_to(target_dir)) for f in target_dir.rglob("*.c")]),
-            "summary": summary,
-            "LLM_context": (
-                "This directory contains only the C source files of an IOCCC winning entry. "
-                "The code is intentionally obfuscated or unusually constructed. "
-                "When analyzing, first read descriptor.json for year, award, and authors. "
-                "Focus on top-of-file comments, macros, and unusual control flow to infer purpose. "
-                "Avoid relying on removed README/Makefiles from the original repo."
-            ),
-        }
-        write_descriptor(target_dir, descriptor)
-
-        manifest_rows.append([year, award, entry, authors, str(target_dir)])
-
-    # Write a manifest CSV at top
+    # Write a manifest CSV at top, streaming rows in as entries finish. If any
+    # entry fails, remove the partial manifest rather than leave it truncated.
     manifest_path = outdir / "manifest.csv"
-    with manifest_path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.writer(f)
-        w.writerow(["year", "award", "entry", "authors", "output_dir"])
-        w.writerows(manifest_rows)
+    worker = functools.partial(process_entries, repo_root=repo_root, outdir=outdir)
+    try:
+        with manifest_path.open("w", newline="", encoding="utf-8", buffering=1 << 20) as f, \
+                ProcessPoolExecutor(max_workers=args.jobs) as ex:
+            w = csv.writer(f)
+            w.writerow(["year", "award", "entry", "authors", "output_dir"])
+            for rows in ex.map(worker, tasks.values(), chunksize=32):
+                w.writerows(rows)
+    except BaseException:
+        manifest_path.unlink(missing_ok=True)
+        raise
 
     print(f"Done. C files organized under: {outdir}")
     print(f"Manifest: {manifest_path}")
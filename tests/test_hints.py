@@ -0,0 +1,72 @@
+import re
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import ioccc_scraper  # noqa: E402
+
+
+# The per-pattern search that search_hints replaced; it must keep giving the same answers.
+BASELINE_HINTS = {
+    "award": [
+        r"(?i)\baward\b\s*:\s*(.+)",
+        r"(?i)\bcategory\b\s*:\s*(.+)",
+        r"(?i)\branking\b\s*:\s*(.+)",
+        r"(?i)\bprize\b\s*:\s*(.+)",
+        r"(?i)\b(honou?rable mention|honorable mention)\b",
+        r"(?i)\b(best|most|worst)\b[^\n]+",
+    ],
+    "authors": [
+        r"(?i)\bauthor[s]?\b\s*:\s*(.+)",
+        r"(?i)\bby\s+([^\n]+)",
+    ],
+    "summary": [
+        r"(?i)\bsummary\b\s*:\s*(.+)",
+        r"(?i)\bdescription\b\s*:\s*(.+)",
+        r"(?i)\bwhat it does\b\s*:\s*(.+)",
+    ],
+}
+
+
+def baseline_search(text):
+    result = {}
+    for field, patterns in BASELINE_HINTS.items():
+        result[field] = None
+        for pat in patterns:
+            m = re.search(pat, text)
+            if m:
+                result[field] = (m.group(1) if m.groups() else m.group(0)).strip()
+                break
+    return result
+
+
+class SearchHintsTest(unittest.TestCase):
+    CASES = [
+        "/* Best Short Program by Jane Doe */",
+        "Award: Best of Show - written by John Smith",
+        "Summary: the most obfuscated program by far",
+        "Description: a tool; Award: grand prize",
+        "by John\nAuthor: Ann\nbest thing\nAward: X\nwhat it does: y",
+        "Honorable Mention\nAuthors: A and B\nCategory: games",
+        "Ranking: 3rd\nprize: none\nDESCRIPTION: worst abuse of the rules by anyone",
+        "nothing to see here",
+        "written by\u00a0Bob",
+        "Award:\u00a0Best\u00a0Abuse\nAuthor\u00a0: Carol\nSummary:\u00a0\u00a0prints stuff",
+        "",
+    ]
+
+    def test_matches_per_pattern_search(self):
+        for text in self.CASES:
+            with self.subTest(text=text):
+                self.assertEqual(ioccc_scraper.search_hints(text.encode("utf-8")), baseline_search(text))
+
+    def test_overlapping_hints_are_kept(self):
+        hints = ioccc_scraper.search_hints(b"Award: Best of Show - written by John Smith")
+        self.assertEqual(hints["award"], "Best of Show - written by John Smith")
+        self.assertEqual(hints["authors"], "John Smith")
+
+
+if __name__ == "__main__":
+    unittest.main()
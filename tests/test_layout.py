@@ -0,0 +1,77 @@
+import contextlib
+import csv
+import io
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import ioccc_scraper  # noqa: E402
+
+
+def write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+class LayoutTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.repo = Path(tmp.name) / "repo"
+        self.out = Path(tmp.name) / "out"
+
+    def run_main(self):
+        argv = ["ioccc_scraper.py", "--local-clone", str(self.repo), "--outdir", str(self.out), "--jobs", "1"]
+        with mock.patch.object(sys, "argv", argv), contextlib.redirect_stdout(io.StringIO()):
+            ioccc_scraper.main()
+        with (self.out / "manifest.csv").open(newline="", encoding="utf-8") as f:
+            return list(csv.reader(f))[1:]
+
+    def test_entry_with_src_subdir_is_one_entry(self):
+        entry = self.repo / "winners" / "2019" / "foo"
+        write(entry / "README", "Award: Best Tool\nAuthor: Jane Doe\nSummary: does things\n")
+        write(entry / "prog.c", "int main(){}\n")
+        write(entry / "src" / "lib.c", "int lib;\n")
+
+        rows = self.run_main()
+
+        target = self.out / "2019" / "Best_Tool" / "foo"
+        self.assertEqual(rows, [["2019", "Best Tool", "foo", "Jane Doe", str(target)]])
+        self.assertTrue((target / "prog.c").is_file())
+        self.assertTrue((target / "src" / "lib.c").is_file())
+        descriptor = json.loads((target / "descriptor.json").read_text(encoding="utf-8"))
+        self.assertEqual(descriptor["original_path"], str(entry.resolve()))
+        self.assertEqual(sorted(descriptor["source_files"]), ["prog.c", str(Path("src") / "lib.c")])
+
+    def test_c_file_directly_under_year(self):
+        c_path = self.repo / "2019" / "lone.c"
+        write(c_path, "/*\n * Award: Solo\n */\nint main(){}\n")
+
+        self.assertEqual(ioccc_scraper.guess_year_and_entry(c_path, self.repo), ("2019", "lone.c"))
+        self.assertEqual(ioccc_scraper.entry_root(c_path, self.repo), self.repo / "2019")
+
+        rows = self.run_main()
+        self.assertEqual(rows, [["2019", "Solo", "lone.c", "unknown", str(self.out / "2019" / "Solo" / "lone.c")]])
+        self.assertTrue((self.out / "2019" / "Solo" / "lone.c" / "lone.c").is_file())
+
+    def test_yearless_roots_share_one_task(self):
+        first = self.repo / "misc" / "a" / "x.c"
+        second = self.repo / "other" / "y.c"
+        dated = self.repo / "1990" / "bar" / "bar.c"
+        for p in (first, second, dated):
+            write(p, "int v;\n")
+
+        tasks = ioccc_scraper.build_tasks([first, second, dated], self.repo)
+
+        self.assertEqual(set(tasks), {("unknown", "unknown"), ("1990", "bar")})
+        self.assertEqual(tasks[("unknown", "unknown")], {first.parent: [first], second.parent: [second]})
+        self.assertEqual(tasks[("1990", "bar")], {self.repo / "1990" / "bar": [dated]})
+
+
+if __name__ == "__main__":
+    unittest.main()